@@ -432,6 +432,32 @@ def start():
                     read_types += "\n        "
                     read_types += "{} = TLObject.read(b)\n        ".format(arg_name)
 
+        qualname = "{}.{}{}".format(c.section, "{}.".format(c.namespace) if c.namespace else "", c.name)
+        slots = [i[0] for i in sorted_args if i != ("flags", "#")]
+
+        # Specialized __eq__ and __repr__ which access the attributes directly instead of walking __slots__
+        eq = "return type(other) is {}".format(capit(c.name))
+
+        if slots:
+            eq = "return (\n            type(other) is {}\n            {}\n        )".format(
+                capit(c.name),
+                "\n            ".join("and self.{0} == other.{0}".format(i) for i in slots)
+            )
+
+        repr_ = "return \"pyrogram.api.{}()\"".format(qualname)
+
+        if slots:
+            repr_ = (
+                "args = []\n\n        {}\n\n        "
+                "return \"pyrogram.api.{}({{}})\".format(\", \".join(args))"
+            ).format(
+                "\n        ".join(
+                    "if self.{0} is not None:\n            args.append(\"{0}=\" + repr(self.{0}))".format(i)
+                    for i in slots
+                ),
+                qualname
+            )
+
         if c.docs:
             description = c.docs.split("|")[0].split("§")[1]
             docstring_args = description + "\n\n    " + docstring_args
@@ -462,8 +488,10 @@ def start():
                         return_arguments=", ".join(
                             ["{0}={0}".format(i[0]) for i in sorted_args if i != ("flags", "#")]
                         ),
-                        slots=", ".join(['"{}"'.format(i[0]) for i in sorted_args if i != ("flags", "#")]),
-                        qualname="{}.{}{}".format(c.section, "{}.".format(c.namespace) if c.namespace else "", c.name)
+                        slots=", ".join(['"{}"'.format(i) for i in slots]),
+                        qualname=qualname,
+                        eq=eq,
+                        repr=repr_
                     )
                 )
 
@@ -16,10 +16,13 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-import ast
+import hashlib
 import os
+import pickle
 import re
 import shutil
+import sys
+from functools import lru_cache
 
 HOME = "compiler/docs"
 DESTINATION = "docs/source/telegram"
@@ -31,57 +34,108 @@ TYPES_PATH = "pyrogram/api/types"
 FUNCTIONS_BASE = "functions"
 TYPES_BASE = "types"
 
+NAMES_CACHE_FILE = ".ast_name_cache.pkl"
+WRITE_BUFFER_SIZE = 1 << 16
 
+CLASS_RE = re.compile(rb"^class (\w+)\(", re.MULTILINE)
+FIELD_RE = re.compile(r"{(\w+)}")
+SNEK_RE_1 = re.compile(r"(.)([A-Z][a-z]+)")
+SNEK_RE_2 = re.compile(r"([a-z0-9])([A-Z])")
+
+
+@lru_cache(maxsize=None)
 def snek(s: str):
-    s = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", s)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s).lower()
+    s = SNEK_RE_1.sub(r"\1_\2", s)
+    return SNEK_RE_2.sub(r"\1_\2", s).lower()
+
+
+def compile_template(template: str) -> str:
+    # Turn "{field}" placeholders into "%(field)s" once, so that rendering thousands of pages
+    # doesn't go through the str.format mini-language parser every time
+    return FIELD_RE.sub(r"%(\1)s", template.replace("%", "%%"))
+
+
+def load_names_cache():
+    try:
+        with open(HOME + "/" + NAMES_CACHE_FILE, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+
+
+def dump_names_cache(cache: dict):
+    with open(HOME + "/" + NAMES_CACHE_FILE, "wb") as f:
+        pickle.dump(cache, f)
 
 
-def generate(source_path, base):
+def write_pages(pages: dict):
+    for directory, files in pages.items():
+        os.makedirs(directory, exist_ok=True)
+
+        for path, content in files:
+            with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(content)
+
+
+def generate(source_path, base, names_cache: dict, used_names: dict, page_template: str, toctree: str):
     all_entities = {}
+    pages = {}
+    version = sys.version_info[:2]
 
     def build(path, level=0):
         last = path.split("/")[-1]
 
-        for i in os.listdir(path):
+        for entry in os.scandir(path):
+            if entry.name.startswith("__"):
+                continue
+
+            if entry.is_dir(follow_symlinks=False):
+                build(entry.path, level=level + 1)
+                continue
+
+            with open(entry.path, "rb") as f:
+                source = f.read()
+
+            key = (hashlib.sha256(source).digest(), version)
+
             try:
-                if not i.startswith("__"):
-                    build("/".join([path, i]), level=level + 1)
-            except NotADirectoryError:
-                with open(path + "/" + i, encoding="utf-8") as f:
-                    p = ast.parse(f.read())
-
-                for node in ast.walk(p):
-                    if isinstance(node, ast.ClassDef):
-                        name = node.name
-                        break
-                else:
-                    continue
-
-                full_path = os.path.basename(path) + "/" + snek(name).replace("_", "-") + ".rst"
-
-                if level:
-                    full_path = base + "/" + full_path
-
-                os.makedirs(os.path.dirname(DESTINATION + "/" + full_path), exist_ok=True)
-
-                with open(DESTINATION + "/" + full_path, "w", encoding="utf-8") as f:
-                    f.write(
-                        page_template.format(
-                            title=name,
-                            title_markup="=" * len(name),
-                            full_class_path="pyrogram.api.{}".format(
-                                ".".join(full_path.split("/")[:-1]) + "." + name
-                            )
-                        )
+                name = names_cache[key]
+            except KeyError:
+                match = CLASS_RE.search(source)
+
+                name = match.group(1).decode() if match else None
+
+            # Only keep the entries looked up by this build, stale ones would make the cache grow forever
+            used_names[key] = name
+
+            if name is None:
+                continue
+
+            full_path = os.path.basename(path) + "/" + snek(name).replace("_", "-") + ".rst"
+
+            if level:
+                full_path = base + "/" + full_path
+
+            destination = DESTINATION + "/" + full_path
+
+            pages.setdefault(os.path.dirname(destination), []).append((
+                destination,
+                page_template % dict(
+                    title=name,
+                    title_markup="=" * len(name),
+                    full_class_path="pyrogram.api.{}".format(
+                        ".".join(full_path.split("/")[:-1]) + "." + name
                     )
+                )
+            ))
 
-                if last not in all_entities:
-                    all_entities[last] = []
+            if last not in all_entities:
+                all_entities[last] = []
 
-                all_entities[last].append(name)
+            all_entities[last].append(name)
 
     build(source_path)
+    write_pages(pages)
 
     for k, v in sorted(all_entities.items()):
         v = sorted(v)
@@ -107,7 +161,7 @@ def generate(source_path, base):
                 k = "Raw " + k
 
             f.write(
-                toctree.format(
+                toctree % dict(
                     title=k.title(),
                     title_markup="=" * len(k),
                     module=module,
@@ -288,6 +342,8 @@ def pyrogram_api():
     with open(HOME + "/template/methods.rst") as f:
         template = f.read()
 
+    pages = []
+
     with open(root + "/index.rst", "w") as f:
         fmt_keys = {}
 
@@ -296,14 +352,17 @@ def pyrogram_api():
             fmt_keys.update({k: "\n    ".join("{0} <{0}>".format(m) for m in methods)})
 
             for method in methods:
-                with open(root + "/{}.rst".format(method), "w") as f2:
-                    title = "{}()".format(method)
+                title = "{}()".format(method)
 
-                    f2.write(title + "\n" + "=" * len(title) + "\n\n")
-                    f2.write(".. automethod:: pyrogram.Client.{}()".format(method))
+                pages.append((
+                    root + "/{}.rst".format(method),
+                    title + "\n" + "=" * len(title) + "\n\n" + ".. automethod:: pyrogram.Client.{}()".format(method)
+                ))
 
         f.write(template.format(**fmt_keys))
 
+    write_pages({root: pages})
+
     # Types
 
     categories = dict(
@@ -391,6 +450,8 @@ def pyrogram_api():
     with open(HOME + "/template/types.rst") as f:
         template = f.read()
 
+    pages = []
+
     with open(root + "/index.rst", "w") as f:
         fmt_keys = {}
 
@@ -401,14 +462,17 @@ def pyrogram_api():
 
             # noinspection PyShadowingBuiltins
             for type in types:
-                with open(root + "/{}.rst".format(type), "w") as f2:
-                    title = "{}".format(type)
+                title = "{}".format(type)
 
-                    f2.write(title + "\n" + "=" * len(title) + "\n\n")
-                    f2.write(".. autoclass:: pyrogram.{}()".format(type))
+                pages.append((
+                    root + "/{}.rst".format(type),
+                    title + "\n" + "=" * len(title) + "\n\n" + ".. autoclass:: pyrogram.{}()".format(type)
+                ))
 
         f.write(template.format(**fmt_keys))
 
+    write_pages({root: pages})
+
     # Bound Methods
 
     categories = dict(
@@ -489,6 +553,8 @@ def pyrogram_api():
     with open(HOME + "/template/bound-methods.rst") as f:
         template = f.read()
 
+    pages = []
+
     with open(root + "/index.rst", "w") as f:
         fmt_keys = {}
 
@@ -502,29 +568,34 @@ def pyrogram_api():
 
             # noinspection PyShadowingBuiltins
             for bm in bound_methods:
-                with open(root + "/{}.rst".format(bm), "w") as f2:
-                    title = "{}()".format(bm)
+                title = "{}()".format(bm)
 
-                    f2.write(title + "\n" + "=" * len(title) + "\n\n")
-                    f2.write(".. automethod:: pyrogram.{}()".format(bm))
+                pages.append((
+                    root + "/{}.rst".format(bm),
+                    title + "\n" + "=" * len(title) + "\n\n" + ".. automethod:: pyrogram.{}()".format(bm)
+                ))
 
         f.write(template.format(**fmt_keys))
 
+    write_pages({root: pages})
 
-def start():
-    global page_template
-    global toctree
 
+def start():
     shutil.rmtree(DESTINATION, ignore_errors=True)
 
     with open(HOME + "/template/page.txt", encoding="utf-8") as f:
-        page_template = f.read()
+        page_template = compile_template(f.read())
 
     with open(HOME + "/template/toctree.txt", encoding="utf-8") as f:
-        toctree = f.read()
+        toctree = compile_template(f.read())
+
+    names_cache = load_names_cache()
+    used_names = {}
+
+    generate(TYPES_PATH, TYPES_BASE, names_cache, used_names, page_template, toctree)
+    generate(FUNCTIONS_PATH, FUNCTIONS_BASE, names_cache, used_names, page_template, toctree)
+    dump_names_cache(used_names)
 
-    generate(TYPES_PATH, TYPES_BASE)
-    generate(FUNCTIONS_PATH, FUNCTIONS_BASE)
     pyrogram_api()
 
 
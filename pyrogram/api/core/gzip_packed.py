@@ -30,6 +30,9 @@ class GzipPacked(TLObject):
 
     QUALNAME = "GzipPacked"
 
+    # Level 1 keeps most of the size reduction at a fraction of the CPU cost of the default (9)
+    COMPRESS_LEVEL = 1
+
     def __init__(self, packed_data: TLObject):
         self.packed_data = packed_data
 
@@ -45,16 +48,4 @@ class GzipPacked(TLObject):
         )
 
     def write(self) -> bytes:
-        b = BytesIO()
-
-        b.write(Int(self.ID, False))
-
-        b.write(
-            Bytes(
-                compress(
-                    self.packed_data.write()
-                )
-            )
-        )
-
-        return b.getvalue()
+        return Int(self.ID, False) + Bytes(compress(self.packed_data.write(), self.COMPRESS_LEVEL))
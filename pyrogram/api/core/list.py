@@ -22,6 +22,9 @@ from .tl_object import TLObject
 class List(list, TLObject):
     __slots__ = []
 
+    def __bool__(self):
+        return len(self) > 0
+
     def __repr__(self):
         return "pyrogram.api.core.List([{}])".format(
             ",".join(TLObject.__repr__(i) for i in self)
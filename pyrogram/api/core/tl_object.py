@@ -19,9 +19,19 @@
 from collections import OrderedDict
 from io import BytesIO
 from json import dumps
+from operator import attrgetter
+from struct import Struct
 
 from ..all import objects
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Constructor IDs are unsigned 32-bit little-endian integers
+unpack_id = Struct("<I").unpack
+
 
 class TLObject:
     __slots__ = []
@@ -30,7 +40,7 @@ class TLObject:
 
     @staticmethod
     def read(b: BytesIO, *args):  # TODO: Rename b -> data
-        return objects[int.from_bytes(b.read(4), "little")].read(b, *args)
+        return objects[unpack_id(b.read(4))[0]].read(b, *args)
 
     def write(self, *args) -> bytes:
         pass
@@ -40,36 +50,62 @@ class TLObject:
         if isinstance(obj, bytes):
             return repr(obj)
 
-        return OrderedDict(
-            [("_", obj.QUALNAME)]
-            + [
-                (attr, getattr(obj, attr))
-                for attr in obj.__slots__
-                if getattr(obj, attr) is not None
-            ]
-        )
+        # TODO: OrderedDict to be removed in Python 3.6
+        result = OrderedDict([("_", obj.QUALNAME)])
+
+        for attr in obj.__slots__:
+            value = getattr(obj, attr)
+
+            if value is not None:
+                result[attr] = value
+
+        return result
 
     def __str__(self) -> str:
-        return dumps(self, indent=4, default=TLObject.default, ensure_ascii=False)
+        if orjson is not None:
+            try:
+                return orjson.dumps(self, default=TLObject.default, option=orjson.OPT_INDENT_2).decode()
+            except TypeError:
+                # orjson can't handle integers wider than 64 bits (e.g.: int128 nonces)
+                pass
+
+        return dumps(self, indent=2, default=TLObject.default, ensure_ascii=False)
 
     def __repr__(self) -> str:
-        return "pyrogram.api.{}({})".format(
-            self.QUALNAME,
-            ", ".join(
-                "{}={}".format(attr, repr(getattr(self, attr)))
-                for attr in self.__slots__
-                if getattr(self, attr) is not None
-            )
-        )
+        args = []
 
-    def __eq__(self, other: "TLObject") -> bool:
         for attr in self.__slots__:
-            try:
-                if getattr(self, attr) != getattr(other, attr):
-                    return False
-            except AttributeError:
-                return False
+            value = getattr(self, attr)
+
+            if value is not None:
+                args.append("{}={!r}".format(attr, value))
+
+        return "pyrogram.api.{}({})".format(self.QUALNAME, ", ".join(args))
+
+    def __eq__(self, other: "TLObject") -> bool:
+        if type(self) is not type(other):
+            return False
+
+        cls = type(self)
+
+        try:
+            getter = cls.__dict__["_slots_getter"]
+        except KeyError:
+            # Fetch all the attributes in a single C-level call when comparing objects. Built lazily and cached per
+            # class rather than in __init_subclass__, which Python 3.5 doesn't support
+            getter = attrgetter(*cls.__slots__) if cls.__slots__ else None
+            cls._slots_getter = getter
+
+        if getter is None:
+            return True
+
+        try:
+            return getter(self) == getter(other)
+        except AttributeError:
+            return False
 
+    def __bool__(self) -> bool:
+        # Objects are always truthy: don't let "if obj:" fall back to __len__ and serialize the whole object
         return True
 
     def __len__(self) -> int:
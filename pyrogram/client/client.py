@@ -166,6 +166,11 @@ class Client(Methods, BaseClient):
             request that raises a flood wait will be automatically invoked again after sleeping for the required amount
             of time. Flood wait exceptions requiring higher waiting times will be raised.
             Defaults to 60 (seconds).
+
+        max_concurrent_uploads (``int``, *optional*):
+            Number of maximum files being uploaded at the same time, e.g.: the items of a media group.
+            Further uploads will wait for a running one to finish; this helps avoiding flood waits.
+            Defaults to 4.
     """
 
     def __init__(
@@ -192,7 +197,8 @@ class Client(Methods, BaseClient):
         parse_mode: str = BaseClient.PARSE_MODES[0],
         no_updates: bool = None,
         takeout: bool = None,
-        sleep_threshold: int = Session.SLEEP_THRESHOLD
+        sleep_threshold: int = Session.SLEEP_THRESHOLD,
+        max_concurrent_uploads: int = BaseClient.MAX_CONCURRENT_UPLOADS
     ):
         super().__init__()
 
@@ -220,6 +226,10 @@ class Client(Methods, BaseClient):
         self.no_updates = no_updates
         self.takeout = takeout
         self.sleep_threshold = sleep_threshold
+        self.max_concurrent_uploads = max_concurrent_uploads
+
+        if max_concurrent_uploads < 1:
+            raise ValueError("max_concurrent_uploads must be at least 1")
 
         if isinstance(session_name, str):
             if session_name == ":memory:" or len(session_name) >= MemoryStorage.SESSION_STRING_SIZE:
@@ -233,6 +243,7 @@ class Client(Methods, BaseClient):
             raise ValueError("Unknown storage engine")
 
         self.dispatcher = Dispatcher(self, 0 if no_updates else workers)
+        self.upload_semaphore = asyncio.Semaphore(max_concurrent_uploads)
 
     def __enter__(self):
         return self.start()
@@ -390,6 +401,11 @@ class Client(Methods, BaseClient):
 
         self.media_sessions.clear()
 
+        for upload_session in self.upload_sessions:
+            await upload_session.stop()
+
+        self.upload_sessions.clear()
+
         self.is_initialized = False
 
     async def send_code(self, phone_number: str) -> SentCode:
@@ -1734,7 +1750,7 @@ class Client(Methods, BaseClient):
 
     async def save_file(
         self,
-        path: Union[str, BinaryIO],
+        path: Union[str, bytes, BinaryIO],
         file_id: int = None,
         file_part: int = 0,
         progress: callable = None,
@@ -1750,8 +1766,9 @@ class Client(Methods, BaseClient):
             available yet in the Client class as an easy-to-use method).
 
         Parameters:
-            path (``str``):
-                The path of the file you want to upload that exists on your local machine.
+            path (``str`` | ``bytes`` | ``BinaryIO``):
+                The path of the file you want to upload that exists on your local machine, its content as bytes or a
+                binary file-like object.
 
             file_id (``int``, *optional*):
                 In case a file part expired, pass the file_id and the file_part to retry uploading that specific chunk.
@@ -1808,10 +1825,13 @@ class Client(Methods, BaseClient):
             fp = open(path, "rb")
         elif isinstance(path, io.IOBase):
             fp = path
+        elif isinstance(path, (bytes, bytearray, memoryview)):
+            # Upload straight from memory, there's no need to write the content to a file first
+            fp = io.BytesIO(path)
         else:
-            raise ValueError("Invalid file. Expected a file path as string or a binary (not text) file pointer")
+            raise ValueError("Invalid file. Expected a file path as string, bytes or a binary (not text) file pointer")
 
-        file_name = fp.name
+        file_name = getattr(fp, "name", "file")
 
         fp.seek(0, os.SEEK_END)
         file_size = fp.tell()
@@ -1830,78 +1850,94 @@ class Client(Methods, BaseClient):
         is_missing_part = file_id is not None
         file_id = file_id or self.rnd_id()
         md5_sum = md5() if not is_big and not is_missing_part else None
-        pool = [Session(self, self.storage.dc_id(), self.storage.auth_key(), is_media=True) for _ in range(pool_size)]
-        workers = [asyncio.ensure_future(worker(session)) for session in pool for _ in range(workers_count)]
-        queue = asyncio.Queue(16)
 
-        try:
-            for session in pool:
-                await session.start()
+        # Bound the number of files being uploaded at the same time across the whole client
+        async with self.upload_semaphore:
+            # Reuse already connected upload sessions, if any, to skip the connection setup
+            reused = [self.upload_sessions.pop() for _ in range(min(pool_size, len(self.upload_sessions)))]
+            pool = reused + [
+                Session(self, self.storage.dc_id(), self.storage.auth_key(), is_media=True)
+                for _ in range(pool_size - len(reused))
+            ]
+            workers = [asyncio.ensure_future(worker(session)) for session in pool for _ in range(workers_count)]
+            queue = asyncio.Queue(16)
 
-            with fp:
-                fp.seek(part_size * file_part)
+            try:
+                # A pooled session that lost its connection is already being restarted in the background: wait for
+                # it to be back instead of starting it a second time
+                for session in reused:
+                    await asyncio.wait_for(session.is_connected.wait(), Session.WAIT_TIMEOUT)
 
-                while True:
-                    chunk = fp.read(part_size)
+                for session in pool[len(reused):]:
+                    await session.start()
 
-                    if not chunk:
-                        if not is_big:
-                            md5_sum = "".join([hex(i)[2:].zfill(2) for i in md5_sum.digest()])
-                        break
-
-                    if is_big:
-                        rpc = functions.upload.SaveBigFilePart(
-                            file_id=file_id,
-                            file_part=file_part,
-                            file_total_parts=file_total_parts,
-                            bytes=chunk
-                        )
-                    else:
-                        rpc = functions.upload.SaveFilePart(
-                            file_id=file_id,
-                            file_part=file_part,
-                            bytes=chunk
-                        )
+                with fp:
+                    fp.seek(part_size * file_part)
 
-                    await queue.put(rpc)
+                    while True:
+                        chunk = fp.read(part_size)
 
-                    if is_missing_part:
-                        return
+                        if not chunk:
+                            if not is_big:
+                                md5_sum = "".join([hex(i)[2:].zfill(2) for i in md5_sum.digest()])
+                            break
 
-                    if not is_big:
-                        md5_sum.update(chunk)
+                        if is_big:
+                            rpc = functions.upload.SaveBigFilePart(
+                                file_id=file_id,
+                                file_part=file_part,
+                                file_total_parts=file_total_parts,
+                                bytes=chunk
+                            )
+                        else:
+                            rpc = functions.upload.SaveFilePart(
+                                file_id=file_id,
+                                file_part=file_part,
+                                bytes=chunk
+                            )
 
-                    file_part += 1
+                        await queue.put(rpc)
 
-                    if progress:
-                        await progress(min(file_part * part_size, file_size), file_size, *progress_args)
-        except Client.StopTransmission:
-            raise
-        except Exception as e:
-            log.error(e, exc_info=True)
-        else:
-            if is_big:
-                return types.InputFileBig(
-                    id=file_id,
-                    parts=file_total_parts,
-                    name=file_name,
+                        if is_missing_part:
+                            return
 
-                )
+                        if not is_big:
+                            md5_sum.update(chunk)
+
+                        file_part += 1
+
+                        if progress:
+                            await progress(min(file_part * part_size, file_size), file_size, *progress_args)
+            except Client.StopTransmission:
+                raise
+            except Exception as e:
+                log.error(e, exc_info=True)
             else:
-                return types.InputFile(
-                    id=file_id,
-                    parts=file_total_parts,
-                    name=file_name,
-                    md5_checksum=md5_sum
-                )
-        finally:
-            for _ in workers:
-                await queue.put(None)
+                if is_big:
+                    return types.InputFileBig(
+                        id=file_id,
+                        parts=file_total_parts,
+                        name=file_name,
 
-            await asyncio.gather(*workers)
+                    )
+                else:
+                    return types.InputFile(
+                        id=file_id,
+                        parts=file_total_parts,
+                        name=file_name,
+                        md5_checksum=md5_sum
+                    )
+            finally:
+                for _ in workers:
+                    await queue.put(None)
+
+                await asyncio.gather(*workers)
 
-            for session in pool:
-                await session.stop()
+                for session in pool:
+                    if session.is_connected.is_set() and len(self.upload_sessions) < Client.UPLOAD_SESSIONS:
+                        self.upload_sessions.append(session)
+                    else:
+                        await session.stop()
 
     async def get_file(
         self,
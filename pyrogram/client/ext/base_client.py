@@ -54,6 +54,8 @@ class BaseClient:
     DOWNLOAD_WORKERS = 4
     OFFLINE_SLEEP = 900
     WORKERS = 4
+    MAX_CONCURRENT_UPLOADS = 4
+    UPLOAD_SESSIONS = 3
     WORKDIR = PARENT_DIR
     CONFIG_FILE = PARENT_DIR / "config.ini"
 
@@ -100,6 +102,8 @@ class BaseClient:
         self.session = None
         self.media_sessions = {}
         self.media_sessions_lock = asyncio.Lock()
+        self.upload_sessions = []
+        self.upload_semaphore = None
 
         self.is_connected = None
         self.is_initialized = None
@@ -32,14 +32,14 @@ class Link(str):
 
     @staticmethod
     def format(url: str, text: str, style: str):
-        if style in ["md", "markdown"]:
+        if style in ("md", "markdown"):
             fmt = Link.MD
-        elif style in ["combined", "html", None]:
+        elif style in ("combined", "html", None):
             fmt = Link.HTML
         else:
             raise ValueError("{} is not a valid style/parse mode".format(style))
 
-        return fmt.format(url=url, text=html.escape(text))
+        return fmt.format(url=url, text=html.escape(text or ""))
 
     # noinspection PyArgumentList
     def __new__(cls, url, text, style):
@@ -49,4 +49,5 @@ class Link(str):
         return Link.format(self.url, other or self.text, style or self.style)
 
     def __str__(self):
-        return Link.format(self.url, self.text, self.style)
+        # The formatted link is the string value itself, computed once in __new__
+        return str.__str__(self)
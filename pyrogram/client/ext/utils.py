@@ -18,6 +18,7 @@
 
 import asyncio
 import base64
+import os
 import struct
 import sys
 from concurrent.futures.thread import ThreadPoolExecutor
@@ -29,6 +30,8 @@ from pyrogram.api.types import PeerUser, PeerChat, PeerChannel
 from . import BaseClient
 from ...api import types
 
+INLINE_MESSAGE_ID = struct.Struct("<iqq")
+
 
 def decode_file_id(s: str) -> bytes:
     s = base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
@@ -92,6 +95,11 @@ async def ainput(prompt: str = ""):
         )).rstrip()
 
 
+async def isfile(path: str) -> bool:
+    # stat() can block for a while on network or FUSE mounts, don't run it inside the event loop
+    return await asyncio.get_event_loop().run_in_executor(None, os.path.isfile, path)
+
+
 def get_offset_date(dialogs):
     for m in reversed(dialogs.messages):
         if isinstance(m, types.MessageEmpty):
@@ -208,9 +216,16 @@ def parse_deleted_messages(client, update) -> List["pyrogram.Message"]:
     return pyrogram.List(parsed_messages)
 
 
+def pack_inline_message_id(msg_id: types.InputBotInlineMessageID) -> str:
+    # The packed id is always 20 bytes long, which encodes to 28 characters ending with a single "=" padding
+    return base64.urlsafe_b64encode(
+        INLINE_MESSAGE_ID.pack(msg_id.dc_id, msg_id.id, msg_id.access_hash)
+    )[:-1].decode()
+
+
 def unpack_inline_message_id(inline_message_id: str) -> types.InputBotInlineMessageID:
     r = inline_message_id + "=" * (-len(inline_message_id) % 4)
-    r = struct.unpack("<iqq", base64.b64decode(r, altchars="-_"))
+    r = INLINE_MESSAGE_ID.unpack(base64.b64decode(r, altchars="-_"))
 
     return types.InputBotInlineMessageID(
         dc_id=r[0],
@@ -43,8 +43,6 @@ class DeletedMessagesHandler(Handler):
             The deleted messages, as list.
     """
 
-    def __init__(self, callback: callable, filters=None):
-        super().__init__(callback, filters)
-
-    async def check(self, messages):
-        return (await super().check(messages[0]))
+    def check(self, messages):
+        # Delegate to Handler.check directly: the coroutine it returns is awaited by the dispatcher
+        return Handler.check(self, messages[0])
@@ -62,7 +62,7 @@ class GetChatMember(BaseClient):
             )
 
             members = getattr(r.full_chat.participants, "participants", [])
-            users = {i.id: i for i in r.users}
+            users = {i.id: pyrogram.User._parse(self, i) for i in r.users}
 
             for member in members:
                 member = pyrogram.ChatMember._parse(self, member, users)
@@ -83,7 +83,7 @@ class GetChatMember(BaseClient):
                 )
             )
 
-            users = {i.id: i for i in r.users}
+            users = {i.id: pyrogram.User._parse(self, i) for i in r.users}
 
             return pyrogram.ChatMember._parse(self, r.participant, users)
         else:
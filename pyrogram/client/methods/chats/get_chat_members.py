@@ -113,7 +113,7 @@ class GetChatMembers(BaseClient):
             )
 
             members = r.full_chat.participants.participants
-            users = {i.id: i for i in r.users}
+            users = {i.id: pyrogram.User._parse(self, i) for i in r.users}
 
             return pyrogram.List(pyrogram.ChatMember._parse(self, member, users) for member in members)
         elif isinstance(peer, types.InputPeerChannel):
@@ -145,7 +145,7 @@ class GetChatMembers(BaseClient):
             )
 
             members = r.participants
-            users = {i.id: i for i in r.users}
+            users = {i.id: pyrogram.User._parse(self, i) for i in r.users}
 
             return pyrogram.List(pyrogram.ChatMember._parse(self, member, users) for member in members)
         else:
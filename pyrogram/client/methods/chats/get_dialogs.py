@@ -96,12 +96,10 @@ class GetDialogs(BaseClient):
 
             messages[chat_id] = await pyrogram.Message._parse(self, message, users, chats)
 
-        parsed_dialogs = []
+        parse_dialog = pyrogram.Dialog._parse
 
-        for dialog in r.dialogs:
-            if not isinstance(dialog, types.Dialog):
-                continue
-
-            parsed_dialogs.append(pyrogram.Dialog._parse(self, dialog, messages, users, chats))
-
-        return pyrogram.List(parsed_dialogs)
+        return pyrogram.List(
+            parse_dialog(self, dialog, messages, users, chats)
+            for dialog in r.dialogs
+            if isinstance(dialog, types.Dialog)
+        )
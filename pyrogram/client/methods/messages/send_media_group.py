@@ -16,6 +16,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 import logging
 import os
 import re
@@ -24,9 +25,96 @@ from typing import Union, List
 import pyrogram
 from pyrogram.api import functions, types
 from pyrogram.client.ext import BaseClient, utils
+from pyrogram.client.types.input_media import InputMediaPhoto, InputMediaVideo
 
 log = logging.getLogger(__name__)
 
+HTTP_URL_RE = re.compile("^https?://")
+NEW_MESSAGE_UPDATES = (types.UpdateNewMessage, types.UpdateNewChannelMessage)
+
+
+async def prepare_photo(client: BaseClient, i: InputMediaPhoto, peer) -> types.InputMediaPhoto:
+    if await utils.isfile(i.media):
+        media = await client.send(
+            functions.messages.UploadMedia(
+                peer=peer,
+                media=types.InputMediaUploadedPhoto(
+                    file=await client.save_file(i.media)
+                )
+            )
+        )
+    elif HTTP_URL_RE.match(i.media):
+        media = await client.send(
+            functions.messages.UploadMedia(
+                peer=peer,
+                media=types.InputMediaPhotoExternal(
+                    url=i.media
+                )
+            )
+        )
+    else:
+        return utils.get_input_media_from_file_id(i.media, i.file_ref, 2)
+
+    return types.InputMediaPhoto(
+        id=types.InputPhoto(
+            id=media.photo.id,
+            access_hash=media.photo.access_hash,
+            file_reference=media.photo.file_reference
+        )
+    )
+
+
+async def prepare_video(client: BaseClient, i: InputMediaVideo, peer) -> types.InputMediaDocument:
+    if await utils.isfile(i.media):
+        # save_file returns None straight away in case there's no thumb
+        file, thumb = await asyncio.gather(client.save_file(i.media), client.save_file(i.thumb))
+
+        media = await client.send(
+            functions.messages.UploadMedia(
+                peer=peer,
+                media=types.InputMediaUploadedDocument(
+                    file=file,
+                    thumb=thumb,
+                    mime_type=client.guess_mime_type(i.media) or "video/mp4",
+                    attributes=[
+                        types.DocumentAttributeVideo(
+                            supports_streaming=i.supports_streaming or None,
+                            duration=i.duration,
+                            w=i.width,
+                            h=i.height
+                        ),
+                        types.DocumentAttributeFilename(file_name=os.path.basename(i.media))
+                    ]
+                )
+            )
+        )
+    elif HTTP_URL_RE.match(i.media):
+        media = await client.send(
+            functions.messages.UploadMedia(
+                peer=peer,
+                media=types.InputMediaDocumentExternal(
+                    url=i.media
+                )
+            )
+        )
+    else:
+        return utils.get_input_media_from_file_id(i.media, i.file_ref, 4)
+
+    return types.InputMediaDocument(
+        id=types.InputDocument(
+            id=media.document.id,
+            access_hash=media.document.access_hash,
+            file_reference=media.document.file_reference
+        )
+    )
+
+
+# Look media builders up by exact type instead of going through an isinstance chain for each item
+MEDIA_HANDLERS = {
+    InputMediaPhoto: prepare_photo,
+    InputMediaVideo: prepare_video
+}
+
 
 class SendMediaGroup(BaseClient):
     # TODO: Add progress parameter
@@ -72,106 +160,42 @@ class SendMediaGroup(BaseClient):
                     ]
                 )
         """
-        multi_media = []
-
-        for i in media:
-            if isinstance(i, pyrogram.InputMediaPhoto):
-                if os.path.isfile(i.media):
-                    media = await self.send(
-                        functions.messages.UploadMedia(
-                            peer=await self.resolve_peer(chat_id),
-                            media=types.InputMediaUploadedPhoto(
-                                file=await self.save_file(i.media)
-                            )
-                        )
-                    )
-
-                    media = types.InputMediaPhoto(
-                        id=types.InputPhoto(
-                            id=media.photo.id,
-                            access_hash=media.photo.access_hash,
-                            file_reference=media.photo.file_reference
-                        )
-                    )
-                elif re.match("^https?://", i.media):
-                    media = await self.send(
-                        functions.messages.UploadMedia(
-                            peer=await self.resolve_peer(chat_id),
-                            media=types.InputMediaPhotoExternal(
-                                url=i.media
-                            )
-                        )
-                    )
-
-                    media = types.InputMediaPhoto(
-                        id=types.InputPhoto(
-                            id=media.photo.id,
-                            access_hash=media.photo.access_hash,
-                            file_reference=media.photo.file_reference
-                        )
-                    )
-                else:
-                    media = utils.get_input_media_from_file_id(i.media, i.file_ref, 2)
-            elif isinstance(i, pyrogram.InputMediaVideo):
-                if os.path.isfile(i.media):
-                    media = await self.send(
-                        functions.messages.UploadMedia(
-                            peer=await self.resolve_peer(chat_id),
-                            media=types.InputMediaUploadedDocument(
-                                file=await self.save_file(i.media),
-                                thumb=self.save_file(i.thumb),
-                                mime_type=self.guess_mime_type(i.media) or "video/mp4",
-                                attributes=[
-                                    types.DocumentAttributeVideo(
-                                        supports_streaming=i.supports_streaming or None,
-                                        duration=i.duration,
-                                        w=i.width,
-                                        h=i.height
-                                    ),
-                                    types.DocumentAttributeFilename(file_name=os.path.basename(i.media))
-                                ]
-                            )
-                        )
-                    )
-
-                    media = types.InputMediaDocument(
-                        id=types.InputDocument(
-                            id=media.document.id,
-                            access_hash=media.document.access_hash,
-                            file_reference=media.document.file_reference
-                        )
-                    )
-                elif re.match("^https?://", i.media):
-                    media = await self.send(
-                        functions.messages.UploadMedia(
-                            peer=await self.resolve_peer(chat_id),
-                            media=types.InputMediaDocumentExternal(
-                                url=i.media
-                            )
-                        )
-                    )
-
-                    media = types.InputMediaDocument(
-                        id=types.InputDocument(
-                            id=media.document.id,
-                            access_hash=media.document.access_hash,
-                            file_reference=media.document.file_reference
-                        )
-                    )
-                else:
-                    media = utils.get_input_media_from_file_id(i.media, i.file_ref, 4)
-
-            multi_media.append(
-                types.InputSingleMedia(
-                    media=media,
-                    random_id=self.rnd_id(),
-                    **await self.parser.parse(i.caption, i.parse_mode)
-                )
+        peer = await self.resolve_peer(chat_id)
+
+        async def prepare(i) -> types.InputSingleMedia:
+            handler = MEDIA_HANDLERS.get(type(i))
+
+            if handler is None:
+                # Subclasses of the supported media types miss the exact type lookup
+                handler = next((h for t, h in MEDIA_HANDLERS.items() if isinstance(i, t)), None)
+
+                if handler is None:
+                    raise ValueError("Unsupported media type: {}".format(type(i).__name__))
+
+            media = await handler(self, i, peer)
+
+            return types.InputSingleMedia(
+                media=media,
+                random_id=self.rnd_id(),
+                **await self.parser.parse(i.caption, i.parse_mode)
             )
 
+        # Items are independent of each other: upload them concurrently, gather keeps the album order
+        tasks = [asyncio.ensure_future(prepare(i)) for i in media]
+
+        try:
+            multi_media = await asyncio.gather(*tasks)
+        except Exception:
+            # Don't leave the other uploads running in the background when one of them fails
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
         r = await self.send(
             functions.messages.SendMultiMedia(
-                peer=await self.resolve_peer(chat_id),
+                peer=peer,
                 multi_media=multi_media,
                 silent=disable_notification or None,
                 reply_to_msg_id=reply_to_message_id
@@ -181,10 +205,7 @@ class SendMediaGroup(BaseClient):
         return await utils.parse_messages(
             self,
             types.messages.Messages(
-                messages=[m.message for m in filter(
-                    lambda u: isinstance(u, (types.UpdateNewMessage, types.UpdateNewChannelMessage)),
-                    r.updates
-                )],
+                messages=[u.message for u in r.updates if isinstance(u, NEW_MESSAGE_UPDATES)],
                 users=r.users,
                 chats=r.chats
             )
@@ -16,7 +16,6 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-import os
 import re
 from typing import Union, BinaryIO
 
@@ -25,6 +24,12 @@ from pyrogram.api import functions, types
 from pyrogram.client.ext import BaseClient, utils
 from pyrogram.errors import FilePartMissing
 
+NEW_OR_SCHEDULED_MESSAGE_UPDATES = (
+    types.UpdateNewMessage,
+    types.UpdateNewChannelMessage,
+    types.UpdateNewScheduledMessage
+)
+
 
 class SendVoice(BaseClient):
     async def send_voice(
@@ -135,7 +140,7 @@ class SendVoice(BaseClient):
 
         try:
             if isinstance(voice, str):
-                if os.path.isfile(voice):
+                if await utils.isfile(voice):
                     file = await self.save_file(voice, progress=progress, progress_args=progress_args)
                     media = types.InputMediaUploadedDocument(
                         mime_type=self.guess_mime_type(voice) or "audio/mpeg",
@@ -166,33 +171,37 @@ class SendVoice(BaseClient):
                     ]
                 )
 
+            peer = await self.resolve_peer(chat_id)
+            parsed = await self.parser.parse(caption, parse_mode)
+            raw_reply_markup = reply_markup.write() if reply_markup else None
+
             while True:
                 try:
                     r = await self.send(
                         functions.messages.SendMedia(
-                            peer=await self.resolve_peer(chat_id),
+                            peer=peer,
                             media=media,
                             silent=disable_notification or None,
                             reply_to_msg_id=reply_to_message_id,
                             random_id=self.rnd_id(),
                             schedule_date=schedule_date,
-                            reply_markup=reply_markup.write() if reply_markup else None,
-                            **await self.parser.parse(caption, parse_mode)
+                            reply_markup=raw_reply_markup,
+                            **parsed
                         )
                     )
                 except FilePartMissing as e:
                     await self.save_file(voice, file_id=file.id, file_part=e.x)
                 else:
-                    for i in r.updates:
-                        if isinstance(
-                            i,
-                            (types.UpdateNewMessage, types.UpdateNewChannelMessage, types.UpdateNewScheduledMessage)
-                        ):
+                    users = {u.id: u for u in r.users}
+                    chats = {c.id: c for c in r.chats}
+
+                    for upd in r.updates:
+                        if isinstance(upd, NEW_OR_SCHEDULED_MESSAGE_UPDATES):
                             return await pyrogram.Message._parse(
-                                self, i.message,
-                                {i.id: i for i in r.users},
-                                {i.id: i for i in r.chats},
-                                is_scheduled=isinstance(i, types.UpdateNewScheduledMessage)
+                                self, upd.message,
+                                users,
+                                chats,
+                                is_scheduled=isinstance(upd, types.UpdateNewScheduledMessage)
                             )
         except BaseClient.StopTransmission:
             return None
@@ -16,8 +16,6 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from base64 import b64encode
-from struct import pack
 from typing import Union, List, Match
 
 import pyrogram
@@ -96,15 +94,7 @@ class CallbackQuery(Object, Update):
         if isinstance(callback_query, types.UpdateBotCallbackQuery):
             message = await client.get_messages(utils.get_peer_id(callback_query.peer), callback_query.msg_id)
         elif isinstance(callback_query, types.UpdateInlineBotCallbackQuery):
-            inline_message_id = b64encode(
-                pack(
-                    "<iqq",
-                    callback_query.msg_id.dc_id,
-                    callback_query.msg_id.id,
-                    callback_query.msg_id.access_hash
-                ),
-                b"-_"
-            ).decode().rstrip("=")
+            inline_message_id = utils.pack_inline_message_id(callback_query.msg_id)
 
         # Try to decode callback query data into string. If that fails, fallback to bytes instead of decoding by
         # ignoring/replacing errors, this way, button clicks will still work.
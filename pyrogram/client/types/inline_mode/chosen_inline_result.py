@@ -31,11 +31,9 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from base64 import b64encode
-from struct import pack
-
 import pyrogram
 from pyrogram.api import types
+from pyrogram.client.ext import utils
 from pyrogram.client.types.object import Object
 from pyrogram.client.types.update import Update
 from pyrogram.client.types.user_and_chats import User
@@ -69,6 +67,8 @@ class ChosenInlineResult(Object, Update):
         objects in updates.
     """
 
+    __slots__ = ("result_id", "from_user", "query", "location", "inline_message_id")
+
     def __init__(
         self,
         *,
@@ -92,24 +92,18 @@ class ChosenInlineResult(Object, Update):
         inline_message_id = None
 
         if isinstance(chosen_inline_result.msg_id, types.InputBotInlineMessageID):
-            inline_message_id = b64encode(
-                pack(
-                    "<iqq",
-                    chosen_inline_result.msg_id.dc_id,
-                    chosen_inline_result.msg_id.id,
-                    chosen_inline_result.msg_id.access_hash
-                ),
-                b"-_"
-            ).decode().rstrip("=")
+            inline_message_id = utils.pack_inline_message_id(chosen_inline_result.msg_id)
+
+        location = None
+        geo = chosen_inline_result.geo
+
+        if isinstance(geo, types.GeoPoint):
+            location = Location(longitude=geo.long, latitude=geo.lat, client=client)
 
         return ChosenInlineResult(
             result_id=str(chosen_inline_result.id),
             from_user=User._parse(client, users[chosen_inline_result.user_id]),
             query=chosen_inline_result.query,
-            location=Location(
-                longitude=chosen_inline_result.geo.long,
-                latitude=chosen_inline_result.geo.lat,
-                client=client
-            ) if chosen_inline_result.geo else None,
+            location=location,
             inline_message_id=inline_message_id
         )
@@ -36,8 +36,9 @@ class InputMediaVideo(InputMedia):
             A valid file reference obtained by a recently fetched media message.
             To be used in combination with a file id in case a file reference is needed.
 
-        thumb (``str``):
+        thumb (``str`` | ``bytes``):
             Thumbnail of the video sent.
+            Pass a file path as string or the thumbnail content as bytes, in case you already have it in memory.
             The thumbnail should be in JPEG format and less than 200 KB in size.
             A thumbnail's width and height should not exceed 320 pixels.
             Thumbnails can't be reused and can be only uploaded as a new file.
@@ -69,7 +70,7 @@ class InputMediaVideo(InputMedia):
         self,
         media: str,
         file_ref: str = None,
-        thumb: str = None,
+        thumb: Union[str, bytes] = None,
         caption: str = "",
         parse_mode: Union[str, None] = object,
         width: int = 0,
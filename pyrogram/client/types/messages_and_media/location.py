@@ -33,6 +33,8 @@ class Location(Object):
             Latitude as defined by sender.
     """
 
+    __slots__ = ("longitude", "latitude")
+
     def __init__(
         self,
         *,
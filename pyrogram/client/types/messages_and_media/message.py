@@ -337,7 +337,7 @@ class Message(Object, Update):
             "pyrogram.ForceReply"
         ] = None
     ):
-        super().__init__(client)
+        self._client = client
 
         self.message_id = message_id
         self.date = date
@@ -19,17 +19,56 @@
 import typing
 from collections import OrderedDict
 from datetime import datetime
+from itertools import chain
 from json import dumps
 
 import pyrogram
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MISSING = object()
+SECRET_ATTRS = frozenset({"phone_number"})
+
+
+def attributes(obj) -> typing.Iterable[typing.Tuple[str, typing.Any]]:
+    slotted = ((attr, getattr(obj, attr, None)) for attr in obj._FIELDS)
+
+    if obj._SLOTS_ONLY:
+        return slotted
+
+    return chain(slotted, obj.__dict__.items())
+
 
 class Meta(type, metaclass=type("", (type,), {"__str__": lambda _: "~hi"})):
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+
+        # Attributes stored in __slots__ don't show up in __dict__: store their public names, in definition order,
+        # so that default, __repr__ and __eq__ can still walk them. Subclasses not declaring __slots__ keep their own
+        # attributes in an instance __dict__ as well
+        slotted = [k for k in reversed(cls.__mro__[:-1]) if "__slots__" in vars(k)]
+
+        cls._SLOTS_ONLY = len(slotted) == len(cls.__mro__) - 1
+        cls._FIELDS = tuple(OrderedDict.fromkeys(
+            attr
+            for k in slotted
+            for attr in ((k.__slots__,) if isinstance(k.__slots__, str) else k.__slots__)
+            if not attr.startswith("_")
+        ))
+
+        # Attributes holding unix timestamps, rendered as dates by default. Only known upfront for slotted classes
+        cls._DATE_ATTRS = frozenset(f for f in cls._FIELDS if f.endswith("date")) if cls._SLOTS_ONLY else None
+
     def __str__(self):
         return "<class 'pyrogram.{}'>".format(self.__name__)
 
 
 class Object(metaclass=Meta):
+    __slots__ = ("_client",)
+
     def __init__(self, client: "pyrogram.BaseClient" = None):
         self._client = client
 
@@ -53,42 +92,71 @@ class Object(metaclass=Meta):
         if isinstance(obj, typing.Match):
             return repr(obj)
 
-        return OrderedDict(
-            [("_", "pyrogram." + obj.__class__.__name__)]
-            + [
-                (attr, "*" * len(getattr(obj, attr)))
-                if attr == "phone_number"
-                else (attr, str(datetime.fromtimestamp(getattr(obj, attr))))
-                if attr.endswith("date")
-                else (attr, getattr(obj, attr))
-                for attr in filter(lambda x: not x.startswith("_"), obj.__dict__)
-                if getattr(obj, attr) is not None
-            ]
-        )
+        # TODO: OrderedDict to be removed in Python 3.6
+        result = OrderedDict([("_", "pyrogram." + obj.__class__.__name__)])
+        date_attrs = obj._DATE_ATTRS
+
+        for attr, value in attributes(obj):
+            if attr[0] == "_" or value is None:
+                continue
+
+            if attr in SECRET_ATTRS:
+                value = "*" * len(value)
+            elif attr in date_attrs if date_attrs is not None else attr.endswith("date"):
+                value = str(datetime.fromtimestamp(value))
+
+            result[attr] = value
+
+        return result
 
     def __str__(self) -> str:
-        return dumps(self, indent=4, default=Object.default, ensure_ascii=False)
+        if orjson is not None:
+            try:
+                return orjson.dumps(self, default=Object.default, option=orjson.OPT_INDENT_2).decode()
+            except TypeError:
+                # orjson can't handle integers wider than 64 bits
+                pass
+
+        return dumps(self, indent=2, default=Object.default, ensure_ascii=False)
 
     def __repr__(self) -> str:
         return "pyrogram.{}({})".format(
             self.__class__.__name__,
             ", ".join(
-                "{}={}".format(attr, repr(getattr(self, attr)))
-                for attr in filter(lambda x: not x.startswith("_"), self.__dict__)
-                if getattr(self, attr) is not None
+                "{}={!r}".format(attr, value)
+                for attr, value in attributes(self)
+                if attr[0] != "_" and value is not None
             )
         )
 
     def __eq__(self, other: "Object") -> bool:
-        for attr in self.__dict__:
-            try:
-                if getattr(self, attr) != getattr(other, attr):
-                    return False
-            except AttributeError:
+        if type(self) is not type(other):
+            return False
+
+        for attr, value in attributes(self):
+            if getattr(other, attr, MISSING) != value:
                 return False
 
         return True
 
+    def __getstate__(self):
+        # The bound client is not serializable, bind a new one after unpickling
+        return dict(attributes(self))
+
+    def __setstate__(self, state):
+        self._client = None
+
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    def __copy__(self):
+        # Unlike pickled objects, shallow copies stay bound to the same client
+        obj = self.__class__.__new__(self.__class__)
+        obj.__setstate__(self.__getstate__())
+        obj._client = self._client
+
+        return obj
+
     def __getitem__(self, item):
         return getattr(self, item)
 
@@ -25,6 +25,8 @@ class ContinuePropagation(StopAsyncIteration):
 
 
 class Update:
+    __slots__ = ()
+
     def stop_propagation(self):
         raise StopPropagation
 
@@ -16,7 +16,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Union, List, Generator, Optional
+from typing import Union, List, Generator, Optional, Awaitable
 
 import pyrogram
 from pyrogram.api import types
@@ -106,6 +106,12 @@ class Chat(Object):
             The linked discussion group (in case of channels) or the linked channel (in case of supergroups).
     """
 
+    __slots__ = (
+        "id", "type", "is_verified", "is_restricted", "is_creator", "is_scam", "is_support", "title", "username",
+        "first_name", "last_name", "photo", "description", "invite_link", "pinned_message", "sticker_set_name",
+        "can_set_sticker_set", "members_count", "restrictions", "permissions", "distance", "linked_chat"
+    )
+
     def __init__(
         self,
         *,
@@ -133,7 +139,7 @@ class Chat(Object):
         distance: int = None,
         linked_chat: "pyrogram.Chat" = None
     ):
-        super().__init__(client)
+        self._client = client
 
         self.id = id
         self.type = type
@@ -161,19 +167,20 @@ class Chat(Object):
     @staticmethod
     def _parse_user_chat(client, user: types.User) -> "Chat":
         peer_id = user.id
+        restriction_reason = user.restriction_reason
 
         return Chat(
             id=peer_id,
             type="bot" if user.bot else "private",
-            is_verified=getattr(user, "verified", None),
-            is_restricted=getattr(user, "restricted", None),
-            is_scam=getattr(user, "scam", None),
-            is_support=getattr(user, "support", None),
+            is_verified=user.verified,
+            is_restricted=user.restricted,
+            is_scam=user.scam,
+            is_support=user.support,
             username=user.username,
             first_name=user.first_name,
             last_name=user.last_name,
             photo=ChatPhoto._parse(client, user.photo, peer_id, user.access_hash),
-            restrictions=pyrogram.List([Restriction._parse(r) for r in user.restriction_reason]) or None,
+            restrictions=pyrogram.List(map(Restriction._parse, restriction_reason)) if restriction_reason else None,
             client=client
         )
 
@@ -194,8 +201,8 @@ class Chat(Object):
 
     @staticmethod
     def _parse_channel_chat(client, channel: types.Channel) -> "Chat":
-        peer_id = utils.get_channel_id(channel.id)
-        restriction_reason = getattr(channel, "restriction_reason", [])
+        peer_id = utils.MAX_CHANNEL_ID - channel.id
+        restriction_reason = getattr(channel, "restriction_reason", None)
 
         return Chat(
             id=peer_id,
@@ -207,7 +214,7 @@ class Chat(Object):
             title=channel.title,
             username=getattr(channel, "username", None),
             photo=ChatPhoto._parse(client, getattr(channel, "photo", None), peer_id, channel.access_hash),
-            restrictions=pyrogram.List([Restriction._parse(r) for r in restriction_reason]) or None,
+            restrictions=pyrogram.List(map(Restriction._parse, restriction_reason)) if restriction_reason else None,
             permissions=ChatPermissions._parse(getattr(channel, "default_banned_rights", None)),
             members_count=getattr(channel, "participants_count", None),
             client=client
@@ -215,52 +222,42 @@ class Chat(Object):
 
     @staticmethod
     def _parse(client, message: types.Message or types.MessageService, users: dict, chats: dict) -> "Chat":
-        if isinstance(message.to_id, types.PeerUser):
-            return Chat._parse_user_chat(client, users[message.to_id.user_id if message.out else message.from_id])
+        to_id = message.to_id
+        peer_type = type(to_id)
+
+        if peer_type is types.PeerUser:
+            return Chat._parse_user_chat(client, users[to_id.user_id if message.out else message.from_id])
 
-        if isinstance(message.to_id, types.PeerChat):
-            return Chat._parse_chat_chat(client, chats[message.to_id.chat_id])
+        if peer_type is types.PeerChat:
+            return Chat._parse_chat_chat(client, chats[to_id.chat_id])
 
-        return Chat._parse_channel_chat(client, chats[message.to_id.channel_id])
+        return Chat._parse_channel_chat(client, chats[to_id.channel_id])
 
     @staticmethod
     def _parse_dialog(client, peer, users: dict, chats: dict):
-        if isinstance(peer, types.PeerUser):
-            return Chat._parse_user_chat(client, users[peer.user_id])
-        elif isinstance(peer, types.PeerChat):
-            return Chat._parse_chat_chat(client, chats[peer.chat_id])
-        else:
-            return Chat._parse_channel_chat(client, chats[peer.channel_id])
+        parser, attr = PEER_PARSERS[type(peer)]
+        return parser(client, (users if attr == "user_id" else chats)[getattr(peer, attr)])
 
     @staticmethod
     async def _parse_full(client, chat_full: types.messages.ChatFull or types.UserFull) -> "Chat":
-        if isinstance(chat_full, types.UserFull):
+        if type(chat_full) is types.UserFull:
             parsed_chat = Chat._parse_user_chat(client, chat_full.user)
             parsed_chat.description = chat_full.about
-
-            if chat_full.pinned_msg_id:
-                parsed_chat.pinned_message = await client.get_messages(
-                    parsed_chat.id,
-                    message_ids=chat_full.pinned_msg_id
-                )
+            pinned_msg_id = chat_full.pinned_msg_id
         else:
             full_chat = chat_full.full_chat
-            chat = None
+            chats = {c.id: c for c in chat_full.chats}
+            chat = chats.get(full_chat.id)
             linked_chat = None
 
-            for c in chat_full.chats:
-                if full_chat.id == c.id:
-                    chat = c
-
-                if isinstance(full_chat, types.ChannelFull):
-                    if full_chat.linked_chat_id == c.id:
-                        linked_chat = c
+            if type(full_chat) is types.ChannelFull:
+                linked_chat = chats.get(full_chat.linked_chat_id)
 
-            if isinstance(full_chat, types.ChatFull):
+            if type(full_chat) is types.ChatFull:
                 parsed_chat = Chat._parse_chat_chat(client, chat)
                 parsed_chat.description = full_chat.about or None
 
-                if isinstance(full_chat.participants, types.ChatParticipants):
+                if type(full_chat.participants) is types.ChatParticipants:
                     parsed_chat.members_count = len(full_chat.participants.participants)
             else:
                 parsed_chat = Chat._parse_channel_chat(client, chat)
@@ -272,27 +269,21 @@ class Chat(Object):
                 if linked_chat:
                     parsed_chat.linked_chat = Chat._parse_channel_chat(client, linked_chat)
 
-            if full_chat.pinned_msg_id:
-                parsed_chat.pinned_message = await client.get_messages(
-                    parsed_chat.id,
-                    message_ids=full_chat.pinned_msg_id
-                )
+            pinned_msg_id = full_chat.pinned_msg_id
 
-            if isinstance(full_chat.exported_invite, types.ChatInviteExported):
+            if type(full_chat.exported_invite) is types.ChatInviteExported:
                 parsed_chat.invite_link = full_chat.exported_invite.link
 
+        if pinned_msg_id:
+            parsed_chat.pinned_message = await client.get_messages(parsed_chat.id, message_ids=pinned_msg_id)
+
         return parsed_chat
 
     @staticmethod
     def _parse_chat(client, chat: Union[types.Chat, types.User, types.Channel]) -> "Chat":
-        if isinstance(chat, types.Chat):
-            return Chat._parse_chat_chat(client, chat)
-        elif isinstance(chat, types.User):
-            return Chat._parse_user_chat(client, chat)
-        else:
-            return Chat._parse_channel_chat(client, chat)
+        return CHAT_PARSERS.get(type(chat), Chat._parse_channel_chat)(client, chat)
 
-    async def archive(self):
+    def archive(self):
         """Bound method *archive* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -313,9 +304,9 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.archive_chats(self.id)
+        return self._client.archive_chats(self.id)
 
-    async def unarchive(self):
+    def unarchive(self):
         """Bound method *unarchive* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -336,10 +327,10 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.unarchive_chats(self.id)
+        return self._client.unarchive_chats(self.id)
 
     # TODO: Remove notes about "All Members Are Admins" for basic groups, the attribute doesn't exist anymore
-    async def set_title(self, title: str) -> bool:
+    def set_title(self, title: str) -> Awaitable[bool]:
         """Bound method *set_title* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -372,12 +363,12 @@ class Chat(Object):
             ValueError: In case a chat_id belongs to user.
         """
 
-        return await self._client.set_chat_title(
+        return self._client.set_chat_title(
             chat_id=self.id,
             title=title
         )
 
-    async def set_description(self, description: str) -> bool:
+    def set_description(self, description: str) -> Awaitable[bool]:
         """Bound method *set_description* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -406,12 +397,12 @@ class Chat(Object):
             ValueError: If a chat_id doesn't belong to a supergroup or a channel.
         """
 
-        return await self._client.set_chat_description(
+        return self._client.set_chat_description(
             chat_id=self.id,
             description=description
         )
 
-    async def set_photo(self, photo: str) -> bool:
+    def set_photo(self, photo: str) -> Awaitable[bool]:
         """Bound method *set_photo* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -440,16 +431,16 @@ class Chat(Object):
             ValueError: if a chat_id belongs to user.
         """
 
-        return await self._client.set_chat_photo(
+        return self._client.set_chat_photo(
             chat_id=self.id,
             photo=photo
         )
 
-    async def kick_member(
+    def kick_member(
         self,
         user_id: Union[int, str],
         until_date: int = 0
-    ) -> Union["pyrogram.Message", bool]:
+    ) -> Awaitable[Union["pyrogram.Message", bool]]:
         """Bound method *kick_member* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -489,16 +480,16 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.kick_chat_member(
+        return self._client.kick_chat_member(
             chat_id=self.id,
             user_id=user_id,
             until_date=until_date
         )
 
-    async def unban_member(
+    def unban_member(
         self,
         user_id: Union[int, str]
-    ) -> bool:
+    ) -> Awaitable[bool]:
         """Bound method *unban_member* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -527,17 +518,17 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.unban_chat_member(
+        return self._client.unban_chat_member(
             chat_id=self.id,
             user_id=user_id,
         )
 
-    async def restrict_member(
+    def restrict_member(
         self,
         user_id: Union[int, str],
         permissions: ChatPermissions,
         until_date: int = 0,
-    ) -> "pyrogram.Chat":
+    ) -> Awaitable["pyrogram.Chat"]:
         """Bound method *unban_member* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -575,14 +566,14 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.restrict_chat_member(
+        return self._client.restrict_chat_member(
             chat_id=self.id,
             user_id=user_id,
             permissions=permissions,
             until_date=until_date,
         )
 
-    async def promote_member(
+    def promote_member(
         self,
         user_id: Union[int, str],
         can_change_info: bool = True,
@@ -593,7 +584,7 @@ class Chat(Object):
         can_invite_users: bool = True,
         can_pin_messages: bool = False,
         can_promote_members: bool = False
-    ) -> bool:
+    ) -> Awaitable[bool]:
         """Bound method *promote_member* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -649,7 +640,7 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.promote_chat_member(
+        return self._client.promote_chat_member(
             chat_id=self.id,
             user_id=user_id,
             can_change_info=can_change_info,
@@ -662,7 +653,7 @@ class Chat(Object):
             can_promote_members=can_promote_members
         )
 
-    async def join(self):
+    def join(self):
         """Bound method *join* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -686,9 +677,9 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.join_chat(self.username or self.id)
+        return self._client.join_chat(self.username or self.id)
 
-    async def leave(self):
+    def leave(self):
         """Bound method *leave* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -706,9 +697,9 @@ class Chat(Object):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.leave_chat(self.id)
+        return self._client.leave_chat(self.id)
 
-    async def export_invite_link(self):
+    def export_invite_link(self):
         """Bound method *export_invite_link* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -729,12 +720,12 @@ class Chat(Object):
             ValueError: In case the chat_id belongs to a user.
         """
 
-        return await self._client.export_chat_invite_link(self.id)
+        return self._client.export_chat_invite_link(self.id)
 
-    async def get_member(
+    def get_member(
         self,
         user_id: Union[int, str],
-    ) -> "pyrogram.ChatMember":
+    ) -> Awaitable["pyrogram.ChatMember"]:
         """Bound method *get_member* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -755,18 +746,18 @@ class Chat(Object):
             :obj:`ChatMember`: On success, a chat member is returned.
         """
 
-        return await self._client.get_chat_member(
+        return self._client.get_chat_member(
             self.id,
             user_id=user_id
         )
 
-    async def get_members(
+    def get_members(
         self,
         offset: int = 0,
         limit: int = 200,
         query: str = "",
         filter: str = "all"
-    ) -> List["pyrogram.ChatMember"]:
+    ) -> Awaitable[List["pyrogram.ChatMember"]]:
         """Bound method *get_members* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -785,7 +776,7 @@ class Chat(Object):
             List of :obj:`ChatMember`: On success, a list of chat members is returned.
         """
 
-        return await self._client.get_chat_members(
+        return self._client.get_chat_members(
             self.id,
             offset=offset,
             limit=limit,
@@ -825,11 +816,11 @@ class Chat(Object):
             filter=filter
         )
 
-    async def add_members(
+    def add_members(
         self,
         user_ids: Union[Union[int, str], List[Union[int, str]]],
         forward_limit: int = 100
-    ) -> bool:
+    ) -> Awaitable[bool]:
         """Bound method *add_members* of :obj:`Chat`.
 
         Use as a shortcut for:
@@ -847,8 +838,23 @@ class Chat(Object):
             ``bool``: On success, True is returned.
         """
 
-        return await self._client.add_chat_members(
+        return self._client.add_chat_members(
             self.id,
             user_ids=user_ids,
             forward_limit=forward_limit
         )
+
+
+# Parser and peer id attribute for each Peer type, users are looked up in the users dict, everything else in chats
+PEER_PARSERS = {
+    types.PeerUser: (Chat._parse_user_chat, "user_id"),
+    types.PeerChat: (Chat._parse_chat_chat, "chat_id"),
+    types.PeerChannel: (Chat._parse_channel_chat, "channel_id")
+}
+
+# Anything else (Channel, ChannelForbidden) is parsed as a channel
+CHAT_PARSERS = {
+    types.Chat: Chat._parse_chat_chat,
+    types.ChatForbidden: Chat._parse_chat_chat,
+    types.User: Chat._parse_user_chat
+}
@@ -125,6 +125,14 @@ class ChatMember(Object):
             True, if the user is allowed to send polls.
     """
 
+    __slots__ = (
+        "user", "status", "title", "until_date", "joined_date", "invited_by", "promoted_by", "restricted_by",
+        "is_member", "can_be_edited", "can_post_messages", "can_edit_messages", "can_delete_messages",
+        "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_pin_messages",
+        "can_send_messages", "can_send_media_messages", "can_send_stickers", "can_send_animations", "can_send_games",
+        "can_use_inline_bots", "can_add_web_page_previews", "can_send_polls"
+    )
+
     def __init__(
         self,
         *,
@@ -160,7 +168,7 @@ class ChatMember(Object):
         can_add_web_page_previews: bool = None,
         can_send_polls: bool = None
     ):
-        super().__init__(client)
+        self._client = client
 
         self.user = user
         self.status = status
@@ -193,81 +201,101 @@ class ChatMember(Object):
 
     @staticmethod
     def _parse(client, member, users) -> "ChatMember":
-        user = pyrogram.User._parse(client, users[member.user_id])
+        parser = MEMBER_PARSERS.get(type(member))
+
+        if parser is None:
+            return None
+
+        user = users[member.user_id]
+        invited_by = users[member.inviter_id] if getattr(member, "inviter_id", None) else None
+
+        return parser(client, member, users, user, invited_by)
+
+    @staticmethod
+    def _parse_member(client, member, users, user, invited_by) -> "ChatMember":
+        return ChatMember(
+            user=user,
+            status="member",
+            joined_date=member.date,
+            invited_by=invited_by,
+            client=client
+        )
+
+    @staticmethod
+    def _parse_creator(client, member, users, user, invited_by) -> "ChatMember":
+        return ChatMember(
+            user=user,
+            status="creator",
+            title=getattr(member, "rank", None),
+            client=client
+        )
 
-        invited_by = (
-            pyrogram.User._parse(client, users[member.inviter_id])
-            if getattr(member, "inviter_id", None) else None
+    @staticmethod
+    def _parse_chat_admin(client, member, users, user, invited_by) -> "ChatMember":
+        return ChatMember(
+            user=user,
+            status="administrator",
+            joined_date=member.date,
+            invited_by=invited_by,
+            client=client
+        )
+
+    @staticmethod
+    def _parse_channel_admin(client, member, users, user, invited_by) -> "ChatMember":
+        permissions = member.admin_rights
+
+        return ChatMember(
+            user=user,
+            status="administrator",
+            title=member.rank,
+            joined_date=member.date,
+            invited_by=invited_by,
+            promoted_by=users[member.promoted_by],
+            can_be_edited=member.can_edit,
+            can_change_info=permissions.change_info,
+            can_post_messages=permissions.post_messages,
+            can_edit_messages=permissions.edit_messages,
+            can_delete_messages=permissions.delete_messages,
+            can_restrict_members=permissions.ban_users,
+            can_invite_users=permissions.invite_users,
+            can_pin_messages=permissions.pin_messages,
+            can_promote_members=permissions.add_admins,
+            client=client
         )
 
-        if isinstance(member, (types.ChannelParticipant, types.ChannelParticipantSelf, types.ChatParticipant)):
-            return ChatMember(
-                user=user,
-                status="member",
-                joined_date=member.date,
-                invited_by=invited_by,
-                client=client
-            )
-
-        if isinstance(member, (types.ChannelParticipantCreator, types.ChatParticipantCreator)):
-            return ChatMember(
-                user=user,
-                status="creator",
-                title=getattr(member, "rank", None),
-                client=client
-            )
-
-        if isinstance(member, types.ChatParticipantAdmin):
-            return ChatMember(
-                user=user,
-                status="administrator",
-                joined_date=member.date,
-                invited_by=invited_by,
-                client=client
-            )
-
-        if isinstance(member, types.ChannelParticipantAdmin):
-            permissions = member.admin_rights
-
-            return ChatMember(
-                user=user,
-                status="administrator",
-                title=member.rank,
-                joined_date=member.date,
-                invited_by=invited_by,
-                promoted_by=pyrogram.User._parse(client, users[member.promoted_by]),
-                can_be_edited=member.can_edit,
-                can_change_info=permissions.change_info,
-                can_post_messages=permissions.post_messages,
-                can_edit_messages=permissions.edit_messages,
-                can_delete_messages=permissions.delete_messages,
-                can_restrict_members=permissions.ban_users,
-                can_invite_users=permissions.invite_users,
-                can_pin_messages=permissions.pin_messages,
-                can_promote_members=permissions.add_admins,
-                client=client
-            )
-
-        if isinstance(member, types.ChannelParticipantBanned):
-            denied_permissions = member.banned_rights
-
-            return ChatMember(
-                user=user,
-                status="kicked" if member.banned_rights.view_messages else "restricted",
-                until_date=denied_permissions.until_date,
-                joined_date=member.date,
-                is_member=not member.left,
-                restricted_by=pyrogram.User._parse(client, users[member.kicked_by]),
-                can_send_messages=not denied_permissions.send_messages,
-                can_send_media_messages=not denied_permissions.send_media,
-                can_send_stickers=not denied_permissions.send_stickers,
-                can_send_animations=not denied_permissions.send_gifs,
-                can_send_games=not denied_permissions.send_games,
-                can_use_inline_bots=not denied_permissions.send_inline,
-                can_add_web_page_previews=not denied_permissions.embed_links,
-                can_send_polls=not denied_permissions.send_polls,
-                can_change_info=not denied_permissions.change_info,
-                can_invite_users=not denied_permissions.invite_users,
-                can_pin_messages=not denied_permissions.pin_messages,
-                client=client
-            )
+    @staticmethod
+    def _parse_banned(client, member, users, user, invited_by) -> "ChatMember":
+        denied_permissions = member.banned_rights
+
+        return ChatMember(
+            user=user,
+            status="kicked" if denied_permissions.view_messages else "restricted",
+            until_date=denied_permissions.until_date,
+            joined_date=member.date,
+            is_member=not member.left,
+            restricted_by=users[member.kicked_by],
+            can_send_messages=not denied_permissions.send_messages,
+            can_send_media_messages=not denied_permissions.send_media,
+            can_send_stickers=not denied_permissions.send_stickers,
+            can_send_animations=not denied_permissions.send_gifs,
+            can_send_games=not denied_permissions.send_games,
+            can_use_inline_bots=not denied_permissions.send_inline,
+            can_add_web_page_previews=not denied_permissions.embed_links,
+            can_send_polls=not denied_permissions.send_polls,
+            can_change_info=not denied_permissions.change_info,
+            can_invite_users=not denied_permissions.invite_users,
+            can_pin_messages=not denied_permissions.pin_messages,
+            client=client
+        )
+
+
+MEMBER_PARSERS = {
+    types.ChannelParticipant: ChatMember._parse_member,
+    types.ChannelParticipantSelf: ChatMember._parse_member,
+    types.ChatParticipant: ChatMember._parse_member,
+    types.ChannelParticipantCreator: ChatMember._parse_creator,
+    types.ChatParticipantCreator: ChatMember._parse_creator,
+    types.ChatParticipantAdmin: ChatMember._parse_chat_admin,
+    types.ChannelParticipantAdmin: ChatMember._parse_channel_admin,
+    types.ChannelParticipantBanned: ChatMember._parse_banned
+}
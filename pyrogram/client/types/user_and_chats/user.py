@@ -26,6 +26,14 @@ from .restriction import Restriction
 from ..object import Object
 from ..update import Update
 
+USER_STATUSES = {
+    types.UserStatusOnline: "online",
+    types.UserStatusOffline: "offline",
+    types.UserStatusRecently: "recently",
+    types.UserStatusLastWeek: "within_week",
+    types.UserStatusLastMonth: "within_month"
+}
+
 
 class User(Object, Update):
     """A Telegram user or bot.
@@ -108,6 +116,12 @@ class User(Object, Update):
             This field is available only in case *is_restricted* is True.
     """
 
+    __slots__ = (
+        "id", "is_self", "is_contact", "is_mutual_contact", "is_deleted", "is_bot", "is_verified", "is_restricted",
+        "is_scam", "is_support", "first_name", "last_name", "status", "last_online_date", "next_offline_date",
+        "username", "language_code", "dc_id", "phone_number", "photo", "restrictions"
+    )
+
     def __init__(
         self,
         *,
@@ -134,7 +148,7 @@ class User(Object, Update):
         photo: ChatPhoto = None,
         restrictions: List[Restriction] = None
     ):
-        super().__init__(client)
+        self._client = client
 
         self.id = id
         self.is_self = is_self
@@ -167,6 +181,10 @@ class User(Object, Update):
         if user is None:
             return None
 
+        photo = user.photo
+        restriction_reason = user.restriction_reason
+        status, last_online_date, next_offline_date = User._parse_status(user.status, user.bot)
+
         return User(
             id=user.id,
             is_self=user.is_self,
@@ -180,58 +198,39 @@ class User(Object, Update):
             is_support=user.support,
             first_name=user.first_name,
             last_name=user.last_name,
-            **User._parse_status(user.status, user.bot),
+            status=status,
+            last_online_date=last_online_date,
+            next_offline_date=next_offline_date,
             username=user.username,
             language_code=user.lang_code,
-            dc_id=getattr(user.photo, "dc_id", None),
+            dc_id=getattr(photo, "dc_id", None),
             phone_number=user.phone,
-            photo=ChatPhoto._parse(client, user.photo, user.id, user.access_hash),
-            restrictions=pyrogram.List([Restriction._parse(r) for r in user.restriction_reason]) or None,
+            photo=ChatPhoto._parse(client, photo, user.id, user.access_hash),
+            restrictions=pyrogram.List(map(Restriction._parse, restriction_reason)) if restriction_reason else None,
             client=client
         )
 
     @staticmethod
     def _parse_status(user_status: types.UpdateUserStatus, is_bot: bool = False):
-        if isinstance(user_status, types.UserStatusOnline):
-            status, date = "online", user_status.expires
-        elif isinstance(user_status, types.UserStatusOffline):
-            status, date = "offline", user_status.was_online
-        elif isinstance(user_status, types.UserStatusRecently):
-            status, date = "recently", None
-        elif isinstance(user_status, types.UserStatusLastWeek):
-            status, date = "within_week", None
-        elif isinstance(user_status, types.UserStatusLastMonth):
-            status, date = "within_month", None
-        else:
-            status, date = "long_time_ago", None
-
-        last_online_date = None
-        next_offline_date = None
-
-        if is_bot:
-            status = None
-
-        if status == "online":
-            next_offline_date = date
-
-        if status == "offline":
-            last_online_date = date
-
-        return {
-            "status": status,
-            "last_online_date": last_online_date,
-            "next_offline_date": next_offline_date
-        }
+        status = None if is_bot else USER_STATUSES.get(type(user_status), "long_time_ago")
+        next_offline_date = user_status.expires if status == "online" else None
+        last_online_date = user_status.was_online if status == "offline" else None
+
+        return status, last_online_date, next_offline_date
 
     @staticmethod
     def _parse_user_status(client, user_status: types.UpdateUserStatus):
+        status, last_online_date, next_offline_date = User._parse_status(user_status.status)
+
         return User(
             id=user_status.user_id,
-            **User._parse_status(user_status.status),
+            status=status,
+            last_online_date=last_online_date,
+            next_offline_date=next_offline_date,
             client=client
         )
 
-    async def archive(self):
+    def archive(self):
         """Bound method *archive* of :obj:`User`.
 
         Use as a shortcut for:
@@ -252,9 +251,9 @@ class User(Object, Update):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.archive_chats(self.id)
+        return self._client.archive_chats(self.id)
 
-    async def unarchive(self):
+    def unarchive(self):
         """Bound method *unarchive* of :obj:`User`.
 
         Use as a shortcut for:
@@ -275,7 +274,7 @@ class User(Object, Update):
             RPCError: In case of a Telegram RPC error.
         """
 
-        return await self._client.unarchive_chats(self.id)
+        return self._client.unarchive_chats(self.id)
 
     def block(self):
         """Bound method *block* of :obj:`User`.
@@ -18,6 +18,7 @@
 
 import asyncio
 import logging
+import random
 from datetime import datetime, timedelta
 from hashlib import sha1
 from io import BytesIO
@@ -29,7 +30,7 @@ from pyrogram.api.all import layer
 from pyrogram.api.core import TLObject, MsgContainer, Int, Long, FutureSalt, FutureSalts
 from pyrogram.connection import Connection
 from pyrogram.crypto import MTProto
-from pyrogram.errors import RPCError, InternalServerError, AuthKeyDuplicated, FloodWait
+from pyrogram.errors import RPCError, InternalServerError, AuthKeyDuplicated, FloodWait, FloodPremiumWait
 from .internals import MsgId, MsgFactory
 
 log = logging.getLogger(__name__)
@@ -424,16 +425,23 @@ class Session:
 
         query = ".".join(query.QUALNAME.split(".")[1:])
 
+        flood_waits = 0
+
         while True:
             try:
                 return await self._send(data, timeout=timeout)
-            except FloodWait as e:
+            except (FloodWait, FloodPremiumWait) as e:
                 amount = e.x
 
-                if amount > sleep_threshold:
+                if amount > sleep_threshold or flood_waits >= Session.MAX_RETRIES:
                     raise
 
-                log.warning('[{}] Sleeping for {}s (required by "{}")'.format(
+                # Add an exponentially growing jitter on top of the required time, so that concurrent
+                # requests hitting the same limit don't all retry at once and hit it again right away
+                amount += random.uniform(0, 2 ** flood_waits)
+                flood_waits += 1
+
+                log.warning('[{}] Sleeping for {:.2f}s (required by "{}")'.format(
                     self.client.session_name, amount, query))
 
                 await asyncio.sleep(amount)
@@ -42,7 +42,7 @@ class Clean(Command):
     API = ["pyrogram/errors/exceptions", "pyrogram/api/functions", "pyrogram/api/types", "pyrogram/api/all.py"]
     DOCS = [
         "docs/source/telegram", "docs/build", "docs/source/api/methods", "docs/source/api/types",
-        "docs/source/api/bound-methods"
+        "docs/source/api/bound-methods", "compiler/docs/.ast_name_cache.pkl"
     ]
 
     ALL = DIST + API + DOCS